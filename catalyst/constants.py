@@ -44,6 +44,12 @@ SUPPORTED_WALLETS = ['metamask', 'ledger', 'trezor', 'bitbox', 'keystore',
 
 DISABLE_ALPHA_WARNING = bool(os.environ.get('CATALYST_DISABLE_ALPHA_WARNING'))
 
+''' Live algorithms can compress the state they save with lz4, which must
+    then be installed:
+    $ export CATALYST_COMPRESS_ALGO_STATE=1
+'''
+COMPRESS_ALGO_STATE = bool(os.environ.get('CATALYST_COMPRESS_ALGO_STATE'))
+
 ALPHA_WARNING_MESSAGE = 'Catalyst is currently in ALPHA. It is going ' \
                         'through rapid development and it is subject to ' \
                         'errors. Please use carefully. We encourage you to ' \
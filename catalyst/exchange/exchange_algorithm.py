@@ -11,18 +11,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import copy
-import pickle
 import signal
 import sys
 from datetime import timedelta
 from os import listdir
-from os.path import isfile, join, exists
+from os.path import isfile, join, exists, splitext
 
 import catalyst.protocol as zp
 import logbook
 import pandas as pd
 from catalyst.algorithm import TradingAlgorithm
-from catalyst.constants import LOG_LEVEL
+from catalyst.constants import LOG_LEVEL, COMPRESS_ALGO_STATE
 from catalyst.exchange.exchange_blotter import ExchangeBlotter
 from catalyst.exchange.exchange_errors import (
     ExchangeRequestError,
@@ -38,7 +37,8 @@ from catalyst.exchange.utils.exchange_utils import (
     save_algo_df,
     clear_frame_stats_directory,
     remove_old_files,
-    group_assets_by_exchange, )
+    group_assets_by_exchange,
+    LZ4, )
 from catalyst.exchange.utils.stats_utils import \
     get_pretty_stats, stats_to_s3, stats_to_algo_folder
 from catalyst.finance.execution import MarketOrder
@@ -420,6 +420,11 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
         self.is_start = kwargs.pop('is_start', True)
         self.end = kwargs.pop('end', None)
         self.is_end = kwargs.pop('is_end', True)
+        self.compress_state = kwargs.pop(
+            'compress_state', COMPRESS_ALGO_STATE
+        )
+        if self.compress_state and not LZ4:
+            raise ImportError('lz4 is required to compress the algo state')
 
         self._clock = None
         self.frame_stats = list()
@@ -481,11 +486,18 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
 
             period_stats_list = []
             for item in files:
-                filename = join(folder, item)
+                key, extension = splitext(item)
+
+                # Skip the temporary files left by interrupted saves
+                if extension != '.p':
+                    continue
 
-                with open(filename, 'rb') as handle:
-                    perf_period = pickle.load(handle)
-                    period_stats_list.extend(perf_period)
+                perf_period = get_algo_object(
+                    algo_name=self.algo_namespace,
+                    key=key,
+                    rel_path='frame_stats',
+                )
+                period_stats_list.extend(perf_period)
 
             stats = pd.DataFrame(period_stats_list)
             stats.set_index('period_close', drop=False, inplace=True)
@@ -841,7 +853,8 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
             algo_name=self.algo_namespace,
             key=now.floor('1D').strftime('%Y-%m-%d'),
             obj=self.frame_stats,
-            rel_path='frame_stats'
+            rel_path='frame_stats',
+            compress=self.compress_state,
         )
 
         error = remove_old_files(
@@ -926,19 +939,22 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
             algo_name=self.algo_namespace,
             key='cumulative_performance_{}'.format(self.mode_name),
             obj=self.perf_tracker.cumulative_performance,
+            compress=self.compress_state,
         )
         log.debug('saving todays performance object')
         save_algo_object(
             algo_name=self.algo_namespace,
             key=today.strftime('%Y-%m-%d'),
             obj=self.perf_tracker.todays_performance,
-            rel_path='daily_performance_{}'.format(self.mode_name)
+            rel_path='daily_performance_{}'.format(self.mode_name),
+            compress=self.compress_state,
         )
         log.debug('saving context.state object')
         save_algo_object(
             algo_name=self.algo_namespace,
             key='context.state_{}'.format(self.mode_name),
-            obj=self.state)
+            obj=self.state,
+            compress=self.compress_state)
 
     def _process_stats(self, data):
         today = data.current_dt.floor('1D')
@@ -1,6 +1,6 @@
 import pandas as pd
 from catalyst.constants import LOG_LEVEL
-from catalyst.exchange.utils.factory import find_exchanges
+from catalyst.exchange.utils.factory import find_exchanges, init_exchanges
 from logbook import Logger
 
 log = Logger('ExchangeAssetFinder', level=LOG_LEVEL)
@@ -17,13 +17,13 @@ class ExchangeAssetFinder(object):
         I don't think that we need this for live-trading.
         Leaving the list empty.
         """
+        # This is what initializes each exchanges at the beginning
+        # of an algo
+        init_exchanges(self.exchanges)
+
         all_sids = []
         for exchange_name in self.exchanges:
-            # This is what initializes each exchanges at the beginning
-            # of an algo
             exchange = self.exchanges[exchange_name]
-            exchange.init()
-
             all_sids += [asset.sid for asset in exchange.assets]
 
         sids = list(set(all_sids))
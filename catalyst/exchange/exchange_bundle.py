@@ -941,7 +941,10 @@ class ExchangeBundle:
         for asset in assets:
             if asset.symbol in INGEST_PAIRS_INCLUDED or self._matches_included_quote(asset.symbol):
                 if asset.exchange_symbol in existing_symbols_defs:
-                    existing_def = existing_symbols_defs[asset.exchange_symbol]
+                    # Copied as get_exchange_symbols returns cached dicts
+                    existing_def = dict(
+                        existing_symbols_defs[asset.exchange_symbol]
+                    )
                     if self.exchange.api.markets[asset.asset_name.replace(' ', '')]['active']:
                         end_date = pd.Timestamp.utcnow().floor('1D')
                         existing_def['end_minute'] = end_date
@@ -9,6 +9,9 @@ import pytz
 from catalyst.exchange.exchange_errors import InvalidHistoryFrequencyError, \
     InvalidHistoryFrequencyAlias
 
+# Candle size and unit of a frequency alias (e.g. 15T, 4h, 1D)
+FREQUENCY_PATTERN = re.compile(r'([0-9].*)?([mdht])', re.I)
+
 
 def get_date_from_ms(ms):
     """
@@ -282,7 +285,7 @@ def get_frequency(freq, data_frequency=None, supported_freqs=['D', 'H', 'T']):
         candle_size = 1
 
     else:
-        freq_match = re.match(r'([0-9].*)?(m|M|d|D|h|H|T)', freq, re.M | re.I)
+        freq_match = FREQUENCY_PATTERN.match(freq)
         if freq_match:
             candle_size = int(freq_match.group(1)) if freq_match.group(1) \
                 else 1
@@ -1,22 +1,178 @@
+import errno
 import hashlib
 import json
+import mmap
 import os
 import pickle
 import shutil
+import struct
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 
 import pandas as pd
 from catalyst.assets._assets import TradingPair
 from six import string_types
-from six.moves.urllib import request
 
 from catalyst.constants import DATE_FORMAT
 from catalyst.exchange.exchange_errors import ExchangeSymbolsNotFound
 from catalyst.exchange.utils.serialization_utils import ExchangeJSONEncoder, \
-    ExchangeJSONDecoder
+    ExchangeJSONDecoder, exchange_object_hook, loads_json
 from catalyst.utils.memoize import weak_lru_cache
-from catalyst.utils.paths import data_root, ensure_directory, \
-    last_modified_time
+from catalyst.utils.paths import data_root, ensure_directory
+
+try:
+    # Arrow IPC persistence of DataFrames
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+try:
+    # Compression of the pickled algo state
+    import lz4.frame
+
+    LZ4 = True
+except ImportError:
+    LZ4 = False
+
+# Headers of the framed pickle format used to persist algo objects with
+# out-of-band buffers (pickle protocol 5). The pickle stream is lz4
+# compressed in the second variant, on request. Legacy files are plain
+# pickles.
+PICKLE_FRAMES_MAGIC = b'CATPKL5\n'
+PICKLE_LZ4_FRAMES_MAGIC = b'CATPKZ5\n'
+
+# Each frame is preceded by its padding and its length. The padding aligns
+# the start of the frame, relative to the start of the file, so that the
+# arrays rebuilt from a memory-mapped file are aligned.
+PICKLE_FRAME_HEADER = struct.Struct('<QQ')
+PICKLE_FRAME_ALIGNMENT = 64
+
+try:
+    from os import replace as _replace_file
+except ImportError:
+    def _replace_file(src, dst):
+        # Python 2: rename only overwrites an existing file on posix, where
+        # it is atomic
+        if os.name == 'nt' and os.path.exists(dst):
+            os.remove(dst)
+
+        os.rename(src, dst)
+
+# How each OHLCV field is aggregated when resampling candles
+RESAMPLE_AGGREGATIONS = dict(
+    open='first',
+    high='max',
+    low='min',
+    close='last',
+    volume='sum',
+)
+
+
+class JSONFileCache(object):
+    """
+    Cache of de-serialized JSON files.
+
+    A file is parsed again only when its modification time, size or inode
+    changes, so repeated reads cost a single stat call. The inode catches
+    files replaced by a rename, even with a coarse modification time.
+    """
+
+    def __init__(self):
+        self._cache = dict()
+
+    def load(self, filename, object_hook=None):
+        """
+        The de-serialized content of a JSON file.
+
+        Parameters
+        ----------
+        filename: str
+        object_hook: callable
+
+        Returns
+        -------
+        Object
+
+        """
+        stat = os.stat(filename)
+        version = (stat.st_mtime, stat.st_size, stat.st_ino)
+
+        cached = self._cache.get(filename)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        # Reading the raw bytes at once lets the parser decode the
+        # whole document in one go
+        with open(filename, 'rb') as data_file:
+            data = loads_json(data_file.read(), object_hook)
+
+        self._cache[filename] = (version, data)
+        return data
+
+    def clear(self):
+        self._cache.clear()
+
+
+json_file_cache = JSONFileCache()
+
+# Folders already created by this process
+_ensured_folders = set()
+
+
+def _ensure_folder(folder):
+    """
+    Create the folder if needed, at most once per process.
+    """
+    if folder not in _ensured_folders:
+        ensure_directory(folder)
+        _ensured_folders.add(folder)
+
+
+def _forget_folder(folder):
+    """
+    Forget a removed folder and its sub-folders, so they are created again.
+    """
+    prefix = os.path.join(folder, '')
+    for ensured in list(_ensured_folders):
+        if ensured == folder or ensured.startswith(prefix):
+            _ensured_folders.discard(ensured)
+
+
+def _atomic_write(filename, mode, writer):
+    """
+    Write a file through a temporary file renamed into place.
+
+    Readers see either the previous or the new content, never a partially
+    written file.
+
+    Parameters
+    ----------
+    filename: str
+    mode: str
+    writer: callable
+        Receives the open file handle.
+
+    """
+    tmp_filename = '{}.tmp'.format(filename)
+    handle = open(tmp_filename, mode)
+    try:
+        with handle:
+            writer(handle)
+
+    except BaseException:
+        os.unlink(tmp_filename)
+        raise
+
+    _replace_file(tmp_filename, filename)
+
+
+def clear_cache():
+    """
+    Clear the cached exchange folders, symbols and auth files.
+    """
+    json_file_cache.clear()
+    _ensured_folders.clear()
+    get_exchange_folder.__call__.cache_clear()
 
 
 def get_sid(symbol):
@@ -57,7 +213,7 @@ def get_remote_folder(environ=None):
 
     root = data_root(environ)
     remote_folder = os.path.join(root, 'remote')
-    ensure_directory(remote_folder)
+    _ensure_folder(remote_folder)
 
     return remote_folder
 
@@ -79,7 +235,7 @@ def get_exchange_folder(exchange_name):
 
     root = data_root()
     exchange_folder = os.path.join(root, 'exchanges', exchange_name)
-    ensure_directory(exchange_folder)
+    _ensure_folder(exchange_folder)
 
     return exchange_folder
 
@@ -123,30 +279,47 @@ def get_exchange_symbols(exchange_name, is_local=False):
     -------
     Object
 
+    Notes
+    -----
+    The content is cached and shared between callers, it must be copied
+    before being modified.
+
     """
     filename = get_exchange_symbols_filename(exchange_name, is_local)
 
-    if os.path.isfile(filename):
-        with open(filename) as data_file:
-            try:
-                data = json.load(data_file, cls=ExchangeJSONDecoder)
-                return data
+    try:
+        return json_file_cache.load(filename, exchange_object_hook)
+
+    except (IOError, OSError) as e:
+        if e.errno != errno.ENOENT:
+            raise
 
-            except ValueError:
-                return dict()
-    else:
         raise ExchangeSymbolsNotFound(
             exchange=exchange_name,
             filename=filename
         )
 
+    except ValueError:
+        return dict()
+
 
 def save_exchange_symbols_dicts(exchange_name, asset_dicts, is_local=False):
+    """
+    Save asset dicts into an exchange_symbols file.
+
+    Parameters
+    ----------
+    exchange_name: str
+    asset_dicts: dict[str, dict[str, object]]
+    is_local: bool
+
+    """
     filename = get_exchange_symbols_filename(
         exchange_name, is_local
     )
-    with open(filename, 'wt') as handle:
-        json.dump(asset_dicts, handle, indent=4, default=symbols_serial)
+    _atomic_write(filename, 'wt', lambda handle: json.dump(
+        asset_dicts, handle, indent=4, default=symbols_serial
+    ))
 
 
 def save_exchange_symbols(exchange_name, assets, is_local=False):
@@ -168,11 +341,7 @@ def save_exchange_symbols(exchange_name, assets, is_local=False):
     for symbol in assets:
         asset_dicts[symbol] = assets[symbol].to_dict()
 
-    filename = get_exchange_symbols_filename(
-        exchange_name, is_local
-    )
-    with open(filename, 'wt') as handle:
-        json.dump(asset_dicts, handle, indent=4, default=symbols_serial)
+    save_exchange_symbols_dicts(exchange_name, asset_dicts, is_local)
 
 
 def get_symbols_string(assets):
@@ -188,8 +357,10 @@ def get_symbols_string(assets):
     str
 
     """
-    array = [assets] if isinstance(assets, TradingPair) else assets
-    return ', '.join([asset.symbol for asset in array])
+    if isinstance(assets, TradingPair):
+        return assets.symbol
+
+    return ', '.join(asset.symbol for asset in assets)
 
 
 def get_exchange_auth(exchange_name, alias=None):
@@ -211,15 +382,13 @@ def get_exchange_auth(exchange_name, alias=None):
     filename = os.path.join(exchange_folder, '{}.json'.format(name))
 
     if os.path.isfile(filename):
-        with open(filename) as data_file:
-            data = json.load(data_file)
-            return data
+        return json_file_cache.load(filename)
     else:
         data = dict(name=exchange_name, key='', secret='')
-        with open(filename, 'w') as f:
-            json.dump(data, f, sort_keys=False, indent=2,
-                      separators=(',', ':'))
-            return data
+        _atomic_write(filename, 'w', lambda f: json.dump(
+            data, f, sort_keys=False, indent=2, separators=(',', ':')
+        ))
+        return data
 
 
 def get_remote_auth(alias=None, environ=None):
@@ -245,10 +414,10 @@ def get_remote_auth(alias=None, environ=None):
             return data
     else:
         data = dict(key='', secret='')
-        with open(filename, 'w') as f:
-            json.dump(data, f, sort_keys=False, indent=2,
-                      separators=(',', ':'))
-            return data
+        _atomic_write(filename, 'w', lambda f: json.dump(
+            data, f, sort_keys=False, indent=2, separators=(',', ':')
+        ))
+        return data
 
 
 def delete_algo_folder(algo_name, environ=None):
@@ -267,6 +436,7 @@ def delete_algo_folder(algo_name, environ=None):
     """
     folder = get_algo_folder(algo_name, environ)
     shutil.rmtree(folder)
+    _forget_folder(folder)
 
 
 def get_algo_folder(algo_name, environ=None):
@@ -288,11 +458,208 @@ def get_algo_folder(algo_name, environ=None):
 
     root = data_root(environ)
     algo_folder = os.path.join(root, 'live_algos', algo_name)
-    ensure_directory(algo_folder)
+    _ensure_folder(algo_folder)
 
     return algo_folder
 
 
+def get_algo_filename(algo_name, name, environ=None, rel_path=None,
+                      ensure_rel_path=False):
+    """
+    The absolute path of a file in the folder of the algorithm.
+
+    Parameters
+    ----------
+    algo_name: str
+    name: str
+    environ:
+    rel_path: str
+    ensure_rel_path: bool
+        Create the rel_path sub-folder if needed.
+
+    Returns
+    -------
+    str
+
+    """
+    if not environ:
+        environ = os.environ
+
+    root = data_root(environ)
+    folder = os.path.join(root, 'live_algos', algo_name)
+    _ensure_folder(folder)
+
+    if rel_path is not None:
+        folder = os.path.join(folder, rel_path)
+
+        if ensure_rel_path:
+            _ensure_folder(folder)
+
+    return os.path.join(folder, name)
+
+
+def dump_pickle_frames(obj, handle, compress=False):
+    """
+    Pickle an object into a binary handle using out-of-band buffers.
+
+    With pickle protocol 5, large contiguous buffers (e.g. the numpy arrays
+    backing a DataFrame) are not copied into the pickle stream. They are
+    written as separate frames after it, each aligned on 64 bytes.
+    Falls back to a regular pickle when protocol 5 is not available.
+
+    Parameters
+    ----------
+    obj: Object
+    handle: file
+    compress: bool
+        Compress the pickle stream, with its repeated attribute names and
+        keys, with lz4. The buffers are left raw so that they can still
+        be loaded without a copy. Loading the file then requires lz4 too.
+
+    """
+    if compress and not LZ4:
+        raise ImportError('lz4 is required to compress pickles')
+
+    if not hasattr(pickle, 'PickleBuffer'):
+        pickle.dump(obj, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        return
+
+    buffers = []
+    data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+
+    if compress:
+        data = lz4.frame.compress(data)
+        handle.write(PICKLE_LZ4_FRAMES_MAGIC)
+
+    else:
+        handle.write(PICKLE_FRAMES_MAGIC)
+
+    # The offsets are relative to the start of the file
+    offset = len(PICKLE_FRAMES_MAGIC)
+    for frame in [memoryview(data)] + [buf.raw() for buf in buffers]:
+        offset += PICKLE_FRAME_HEADER.size
+        padding = -offset % PICKLE_FRAME_ALIGNMENT
+
+        handle.write(PICKLE_FRAME_HEADER.pack(padding, frame.nbytes))
+        handle.write(b'\0' * padding)
+        handle.write(frame)
+
+        offset += padding + frame.nbytes
+
+
+def load_pickle_frames(handle):
+    """
+    Load an object written by dump_pickle_frames.
+
+    The file is memory-mapped copy-on-write and the out-of-band buffers
+    are handed to the unpickler as views of the mapping. Large arrays are
+    therefore backed by the page cache instead of being copied, and they
+    remain writable. On Windows, the file is read into a single buffer
+    instead. Legacy plain pickles are loaded as is.
+
+    Parameters
+    ----------
+    handle: file
+
+    Returns
+    -------
+    Object
+
+    """
+    if not hasattr(pickle, 'PickleBuffer'):
+        # Without protocol 5, dump_pickle_frames writes plain pickles.
+        # Python 2 mmap objects do not support memoryview either.
+        return pickle.load(handle)
+
+    size = os.fstat(handle.fileno()).st_size
+    if size == 0:
+        # Empty files cannot be mapped, let pickle raise EOFError
+        return pickle.load(handle)
+
+    if os.name == 'nt':
+        # Windows cannot replace a file which is still mapped, which is
+        # what the next save of the same key does
+        payload = bytearray(size)
+        handle.readinto(payload)
+
+    else:
+        payload = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    view = memoryview(payload)
+
+    magic = bytes(view[:len(PICKLE_FRAMES_MAGIC)])
+    if magic not in (PICKLE_FRAMES_MAGIC, PICKLE_LZ4_FRAMES_MAGIC):
+        return pickle.loads(view)
+
+    if magic == PICKLE_LZ4_FRAMES_MAGIC and not LZ4:
+        raise ImportError('lz4 is required to load the compressed pickle '
+                          '{}'.format(getattr(handle, 'name', handle)))
+
+    frames = []
+    offset = len(PICKLE_FRAMES_MAGIC)
+    while offset < size:
+        padding, length = PICKLE_FRAME_HEADER.unpack_from(view, offset)
+        offset += PICKLE_FRAME_HEADER.size + padding
+        frames.append(view[offset:offset + length])
+        offset += length
+
+    data = frames[0]
+    if magic == PICKLE_LZ4_FRAMES_MAGIC:
+        data = lz4.frame.decompress(data)
+
+    return pickle.loads(data, buffers=frames[1:])
+
+
+def dump_arrow_df(df, handle):
+    """
+    Write a DataFrame into a binary handle in the Arrow IPC file format.
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+    handle: file
+
+    """
+    if pa is None:
+        raise ImportError('pyarrow is required to save arrow files')
+
+    if not isinstance(df, pd.DataFrame):
+        raise ValueError(
+            'Only DataFrames can be saved as arrow, got {}'.format(type(df))
+        )
+
+    table = pa.Table.from_pandas(df)
+    writer = pa.ipc.new_file(handle, table.schema)
+    try:
+        writer.write_table(table)
+    finally:
+        writer.close()
+
+
+def load_arrow_df(filename):
+    """
+    Read a DataFrame written by dump_arrow_df.
+
+    The file is memory-mapped, so the Arrow columns are converted to
+    pandas straight from the page cache, without reading the file into
+    an intermediate buffer first.
+
+    Parameters
+    ----------
+    filename: str
+
+    Returns
+    -------
+    DataFrame
+
+    """
+    if pa is None:
+        raise ImportError('pyarrow is required to load arrow files')
+
+    with pa.memory_map(filename) as source:
+        return pa.ipc.open_file(source).read_all().to_pandas()
+
+
 def get_algo_object(algo_name, key, environ=None, rel_path=None, how='pickle'):
     """
     The de-serialized object of the algo name and key.
@@ -304,6 +671,7 @@ def get_algo_object(algo_name, key, environ=None, rel_path=None, how='pickle'):
     environ:
     rel_path: str
     how: str
+        'pickle' (default), 'json' or 'arrow'.
 
     Returns
     -------
@@ -313,30 +681,39 @@ def get_algo_object(algo_name, key, environ=None, rel_path=None, how='pickle'):
     if algo_name is None:
         return None
 
-    folder = get_algo_folder(algo_name, environ)
-
-    if rel_path is not None:
-        folder = os.path.join(folder, rel_path)
+    if how == 'pickle':
+        name = '{}.p'.format(key)
+    elif how == 'arrow':
+        name = '{}.arrow'.format(key)
+    else:
+        name = '{}.json'.format(key)
 
-    name = '{}.p'.format(key) if how == 'pickle' else '{}.json'.format(key)
-    filename = os.path.join(folder, name)
+    filename = get_algo_filename(algo_name, name, environ, rel_path)
 
-    if os.path.isfile(filename):
+    # Only a missing file means that there is no object, a corrupted
+    # file raises
+    try:
         if how == 'pickle':
             with open(filename, 'rb') as handle:
-                return pickle.load(handle)
+                return load_pickle_frames(handle)
+
+        elif how == 'arrow':
+            return load_arrow_df(filename)
 
         else:
             with open(filename) as data_file:
                 data = json.load(data_file, cls=ExchangeJSONDecoder)
                 return data
 
-    else:
+    except (IOError, OSError) as e:
+        if e.errno != errno.ENOENT:
+            raise
+
         return None
 
 
 def save_algo_object(algo_name, key, obj, environ=None, rel_path=None,
-                     how='pickle'):
+                     how='pickle', compress=False):
     """
     Serialize and save an object by algo name and key.
 
@@ -348,26 +725,38 @@ def save_algo_object(algo_name, key, obj, environ=None, rel_path=None,
     environ:
     rel_path: str
     how: str
+        'pickle' (default), 'json' or 'arrow'. Arrow is restricted to
+        DataFrames and requires pyarrow.
+    compress: bool
+        Compress pickles with lz4, which is then required to load them.
 
     """
-    folder = get_algo_folder(algo_name, environ)
-
-    if rel_path is not None:
-        folder = os.path.join(folder, rel_path)
-        ensure_directory(folder)
-
     if how == 'json':
-        filename = os.path.join(folder, '{}.json'.format(key))
-        with open(filename, 'wt') as handle:
-            json.dump(obj, handle, indent=4, cls=ExchangeJSONEncoder)
+        filename = get_algo_filename(
+            algo_name, '{}.json'.format(key), environ, rel_path, True
+        )
+        _atomic_write(filename, 'wt', lambda handle: json.dump(
+            obj, handle, indent=4, cls=ExchangeJSONEncoder
+        ))
+
+    elif how == 'arrow':
+        filename = get_algo_filename(
+            algo_name, '{}.arrow'.format(key), environ, rel_path, True
+        )
+        _atomic_write(
+            filename, 'wb', lambda handle: dump_arrow_df(obj, handle)
+        )
 
     else:
-        filename = os.path.join(folder, '{}.p'.format(key))
-        with open(filename, 'wb') as handle:
-            pickle.dump(obj, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        filename = get_algo_filename(
+            algo_name, '{}.p'.format(key), environ, rel_path, True
+        )
+        _atomic_write(filename, 'wb', lambda handle: dump_pickle_frames(
+            obj, handle, compress
+        ))
 
 
-def get_algo_df(algo_name, key, environ=None, rel_path=None):
+def get_algo_df(algo_name, key, environ=None, rel_path=None, how='pickle'):
     """
     The de-serialized DataFrame of an algo name and key.
 
@@ -377,18 +766,33 @@ def get_algo_df(algo_name, key, environ=None, rel_path=None):
     key: str
     environ:
     rel_path: str
+    how: str
+        The format the DataFrame was saved with, 'pickle' or 'parquet'.
 
     Returns
     -------
     DataFrame
 
+    Notes
+    -----
+    Frames saved as csv by earlier versions are still loaded when
+    no file of the requested format exists for the key.
+
     """
-    folder = get_algo_folder(algo_name, environ)
+    extension = '.parquet' if how == 'parquet' else '.pkl'
+    filename = get_algo_filename(algo_name, key + extension, environ, rel_path)
 
-    if rel_path is not None:
-        folder = os.path.join(folder, rel_path)
+    if os.path.isfile(filename):
+        try:
+            if how == 'parquet':
+                return pd.read_parquet(filename, engine='pyarrow')
 
-    filename = os.path.join(folder, key + '.csv')
+            with open(filename, 'rb') as handle:
+                return load_pickle_frames(handle)
+        except IOError:
+            return pd.DataFrame()
+
+    filename = get_algo_filename(algo_name, key + '.csv', environ, rel_path)
 
     if os.path.isfile(filename):
         try:
@@ -400,9 +804,10 @@ def get_algo_df(algo_name, key, environ=None, rel_path=None):
         return pd.DataFrame()
 
 
-def save_algo_df(algo_name, key, df, environ=None, rel_path=None):
+def save_algo_df(algo_name, key, df, environ=None, rel_path=None,
+                 how='pickle'):
     """
-    Serialize to csv and save a DataFrame by algo name and key.
+    Serialize and save a DataFrame by algo name and key.
 
     Parameters
     ----------
@@ -411,17 +816,26 @@ def save_algo_df(algo_name, key, df, environ=None, rel_path=None):
     df: pd.DataFrame
     environ:
     rel_path: str
+    how: str
+        'pickle' (default) or 'parquet'. Parquet files are compressed
+        and readable by other tools, but require pyarrow.
 
     """
-    folder = get_algo_folder(algo_name, environ)
-    if rel_path is not None:
-        folder = os.path.join(folder, rel_path)
-        ensure_directory(folder)
-
-    filename = os.path.join(folder, key + '.csv')
+    if how == 'parquet':
+        filename = get_algo_filename(
+            algo_name, key + '.parquet', environ, rel_path, True
+        )
+        _atomic_write(filename, 'wb', lambda handle: df.to_parquet(
+            handle, engine='pyarrow', compression='snappy'
+        ))
 
-    with open(filename, 'wt') as handle:
-        df.to_csv(handle, encoding='UTF_8')
+    else:
+        filename = get_algo_filename(
+            algo_name, key + '.pkl', environ, rel_path, True
+        )
+        _atomic_write(
+            filename, 'wb', lambda handle: dump_pickle_frames(df, handle)
+        )
 
 
 def clear_frame_stats_directory(algo_name):
@@ -444,6 +858,7 @@ def clear_frame_stats_directory(algo_name):
     if os.path.exists(folder):
         try:
             shutil.rmtree(folder)
+            _forget_folder(folder)
         except OSError:
             error = 'unable to remove {}, the analyze ' \
                     'data will be inconsistent'.format(folder)
@@ -471,7 +886,7 @@ def remove_old_files(algo_name, today, rel_path, environ=None):
     error = None
     algo_folder = get_algo_folder(algo_name, environ)
     folder = os.path.join(algo_folder, rel_path)
-    ensure_directory(folder)
+    _ensure_folder(folder)
 
     # run on all files in the folder
     for f in os.listdir(folder):
@@ -505,7 +920,7 @@ def get_exchange_minute_writer_root(exchange_name):
     exchange_folder = get_exchange_folder(exchange_name)
 
     minute_data_folder = os.path.join(exchange_folder, 'minute_data')
-    ensure_directory(minute_data_folder)
+    _ensure_folder(minute_data_folder)
 
     return minute_data_folder
 
@@ -525,6 +940,7 @@ def get_exchange_bundles_folder(exchange_name):
     """
     exchange_folder = get_exchange_folder(exchange_name)
 
+    # Not memoized, ExchangeBundle.clean removes this folder
     temp_bundles = os.path.join(exchange_folder, 'temp_bundles')
     ensure_directory(temp_bundles)
 
@@ -578,31 +994,43 @@ def perf_serial(obj):
     raise TypeError("Type %s not serializable" % type(obj))
 
 
-def get_common_assets(exchanges):
+def get_common_assets(exchanges, max_workers=None):
     """
     The assets available in all specified exchanges.
 
+    The exchanges are queried concurrently.
+
     Parameters
     ----------
-    exchanges: list[Exchange]
+    exchanges: dict[str, Exchange]
+    max_workers: int
+        The maximum number of concurrent exchange queries, to stay within
+        rate limits. Defaults to one thread per exchange.
 
     Returns
     -------
     list[TradingPair]
 
     """
-    symbols = []
-    for exchange_name in exchanges:
-        s = [asset.symbol for asset in exchanges[exchange_name].get_assets()]
-        symbols.append(s)
+    if max_workers is None:
+        max_workers = len(exchanges)
+
+    def get_assets_by_symbol(exchange_name):
+        return dict(
+            (asset.symbol, asset)
+            for asset in exchanges[exchange_name].get_assets()
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        assets_by_symbol = list(executor.map(get_assets_by_symbol, exchanges))
 
-    inter_symbols = set.intersection(*map(set, symbols))
+    inter_symbols = set.intersection(*map(set, assets_by_symbol))
 
+    # The assets were already resolved by get_assets, no further lookup
     assets = []
     for symbol in inter_symbols:
-        for exchange_name in exchanges:
-            asset = exchanges[exchange_name].get_asset(symbol)
-            assets.append(asset)
+        for exchange_assets in assets_by_symbol:
+            assets.append(exchange_assets[symbol])
 
     return assets
 
@@ -622,23 +1050,48 @@ def resample_history_df(df, freq, field, start_dt=None):
     DataFrame
 
     """
-    if field == 'open':
-        agg = 'first'
-    elif field == 'high':
-        agg = 'max'
-    elif field == 'low':
-        agg = 'min'
-    elif field == 'close':
-        agg = 'last'
-    elif field == 'volume':
-        agg = 'sum'
-    else:
+    try:
+        agg = RESAMPLE_AGGREGATIONS[field]
+    except KeyError:
         raise ValueError('Invalid field.')
 
     resampled_df = df.resample(
         freq, closed='left', label='left'
     ).agg(agg)  # type: pd.DataFrame
 
+    return _trim_resampled_df(resampled_df, start_dt)
+
+
+def resample_history_ohlcv(df, freq, start_dt=None):
+    """
+    Resample all the OHCLV columns of a DataFrame in a single pass.
+
+    Parameters
+    ----------
+    df: DataFrame
+    freq: str
+    start_dt: datetime
+
+    Returns
+    -------
+    DataFrame
+
+    """
+    try:
+        agg = dict(
+            (field, RESAMPLE_AGGREGATIONS[field]) for field in df.columns
+        )
+    except KeyError:
+        raise ValueError('Invalid field.')
+
+    resampled_df = df.resample(
+        freq, closed='left', label='left'
+    ).agg(agg)[df.columns]  # type: pd.DataFrame
+
+    return _trim_resampled_df(resampled_df, start_dt)
+
+
+def _trim_resampled_df(resampled_df, start_dt):
     # Because the samples are closed left, we get one more candle at
     # the beginning then the requested number for bars. Removing this
     # candle to avoid confusion.
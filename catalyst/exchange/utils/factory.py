@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor, wait
 
 from catalyst.constants import LOG_LEVEL
 from catalyst.exchange.ccxt.ccxt_exchange import CCXT
@@ -53,6 +54,36 @@ def get_exchanges(exchange_names):
     return exchanges
 
 
+def init_exchanges(exchanges, max_workers=8):
+    """
+    Initialize exchanges concurrently.
+
+    Each exchange loads its markets, from the network when the local copy
+    is outdated, and its symbols. Doing it in parallel avoids waiting on
+    each exchange in turn when an algo starts.
+
+    Parameters
+    ----------
+    exchanges: dict[str, Exchange]
+    max_workers: int
+        The maximum number of exchanges initialized at the same time.
+
+    """
+    if not exchanges:
+        return
+
+    with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(exchanges))) as executor:
+        futures = [
+            executor.submit(exchange.init) for exchange in exchanges.values()
+        ]
+        wait(futures)
+
+    # Raise the first initialization error, if any
+    for future in futures:
+        future.result()
+
+
 def find_exchanges(features=None, skip_blacklist=True, is_authenticated=False,
                    quote_currency=None):
     """
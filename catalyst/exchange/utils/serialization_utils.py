@@ -6,6 +6,14 @@ import pandas as pd
 from catalyst.constants import DATE_TIME_FORMAT
 from six import string_types
 
+try:
+    # faster JSON parsing
+    import orjson
+
+    ORJSON = True
+except ImportError:
+    ORJSON = False
+
 
 class ExchangeJSONEncoder(json.JSONEncoder):
     def default(self, obj):
@@ -43,6 +51,66 @@ class ExchangeJSONDecoder(json.JSONDecoder):
         return obj
 
 
+# The object hook of ExchangeJSONDecoder, converting date strings to
+# Timestamps, for use outside of json.load
+exchange_object_hook = ExchangeJSONDecoder().object_hook
+
+
+def _apply_object_hook(obj, object_hook):
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            obj[key] = _apply_object_hook(value, object_hook)
+
+        return object_hook(obj)
+
+    elif isinstance(obj, list):
+        return [_apply_object_hook(item, object_hook) for item in obj]
+
+    return obj
+
+
+def _json_loads(data, object_hook=None):
+    # json.loads only accepts bytes from Python 3.6
+    if isinstance(data, bytes):
+        data = data.decode('utf-8')
+
+    return json.loads(data, object_hook=object_hook)
+
+
+def loads_json(data, object_hook=None):
+    """
+    De-serialize a JSON document, using orjson when available.
+
+    Parameters
+    ----------
+    data: str or bytes
+        UTF-8 encoded bytes are parsed by orjson without a separate
+        decoding step.
+    object_hook: callable
+        Applied to every decoded dict, like the json.loads argument.
+
+    Returns
+    -------
+    Object
+
+    """
+    if not ORJSON:
+        return _json_loads(data, object_hook)
+
+    try:
+        obj = orjson.loads(data)
+
+    except ValueError:
+        # orjson is strict RFC 8259 and rejects the NaN and Infinity
+        # literals written by the json module, which accepts them.
+        return _json_loads(data, object_hook)
+
+    if object_hook is not None:
+        obj = _apply_object_hook(obj, object_hook)
+
+    return obj
+
+
 def portfolio_to_dict(portfolio):
     positions = []
     for asset in portfolio.positions:
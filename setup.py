@@ -247,7 +247,7 @@ def extras_requires(conda_format=False):
         extra: read_requirements('etc/requirements_{0}.txt'.format(extra),
                                  strict_bounds=True,
                                  conda_format=conda_format)
-        for extra in ('dev', 'talib')
+        for extra in ('dev', 'talib', 'speedups')
     }
     extras['all'] = [req for reqs in extras.values() for req in reqs]
 
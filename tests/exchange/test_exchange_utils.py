@@ -1,14 +1,37 @@
 from catalyst.exchange.utils.exchange_utils import transform_candles_to_df, \
-    forward_fill_df_if_needed, get_candles_df
+    forward_fill_df_if_needed, get_candles_df, get_algo_object, \
+    save_algo_object, get_algo_df, save_algo_df, get_algo_folder, \
+    JSONFileCache, resample_history_df, resample_history_ohlcv, \
+    _replace_file, _atomic_write, get_common_assets, LZ4, \
+    PICKLE_LZ4_FRAMES_MAGIC
 
-from catalyst.testing.fixtures import WithLogger, CatalystTestCase
+from catalyst.exchange.utils.factory import init_exchanges
+from catalyst.exchange.exchange_algorithm import ExchangeTradingAlgorithmLive
+from catalyst.testing.fixtures import WithLogger, CatalystTestCase, \
+    WithInstanceTmpDir
+from mock import Mock, patch
+from collections import OrderedDict
 from datetime import timedelta
-from pandas import Timestamp, DataFrame, concat
+from unittest import skipIf
+from pandas import Timestamp, DataFrame, concat, date_range
 
+import json
 import numpy as np
+import os
+import pickle
 
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
 
-class TestExchangeUtils(WithLogger, CatalystTestCase):
+
+class Unpicklable(object):
+    def __reduce__(self):
+        raise TypeError('not picklable')
+
+
+class TestExchangeUtils(WithLogger, WithInstanceTmpDir, CatalystTestCase):
     @classmethod
     def get_specific_field_from_df(cls, df, field, asset):
         new_df = DataFrame(df[field])
@@ -173,3 +196,298 @@ class TestExchangeUtils(WithLogger, CatalystTestCase):
         self.verify_forward_fill_df_if_needed(candles, periods, expected_df)
         # Not the same due to dropna - commenting out for now
         # self.verify_get_candles_df(assets, candles, periods[2], expected_df)
+
+    def test_algo_object_round_trip(self):
+        environ = {'CATALYST_ROOT': self.instance_tmpdir.path}
+        df = DataFrame(
+            data=np.random.rand(100, 5),
+            index=date_range('2018-03-01', periods=100, freq='T', tz='UTC'),
+            columns=['open', 'high', 'low', 'close', 'volume'],
+        )
+        state = dict(df=df, counter=3)
+
+        save_algo_object('test_algo', 'state', state, environ=environ)
+        observed = get_algo_object('test_algo', 'state', environ=environ)
+
+        assert (observed['counter'] == 3)
+        assert (observed['df'].equals(df))
+
+        assert (get_algo_object('test_algo', 'missing',
+                                environ=environ) is None)
+
+    def test_failed_save_leaves_no_file(self):
+        environ = {'CATALYST_ROOT': self.instance_tmpdir.path}
+
+        with self.assertRaises(TypeError):
+            save_algo_object('test_algo', 'state', Unpicklable(),
+                             environ=environ)
+
+        assert (os.listdir(get_algo_folder('test_algo', environ)) == [])
+
+        # an error opening the temporary file is raised as is
+        filename = os.path.join(
+            self.instance_tmpdir.path, 'missing', 'auth.json'
+        )
+        with patch('os.unlink') as unlink:
+            with self.assertRaises(IOError):
+                _atomic_write(filename, 'w', lambda handle: None)
+
+        assert (not unlink.called)
+
+    def test_algo_object_compressed(self):
+        environ = {'CATALYST_ROOT': self.instance_tmpdir.path}
+        state = dict(counter=3, names=['btc_usdt'] * 100)
+
+        if not LZ4:
+            with self.assertRaises(ImportError):
+                save_algo_object('test_algo', 'state', state,
+                                 environ=environ, compress=True)
+            return
+
+        save_algo_object('test_algo', 'state', state, environ=environ,
+                         compress=True)
+        assert (get_algo_object('test_algo', 'state',
+                                environ=environ) == state)
+
+    def test_algo_object_buffers_aligned(self):
+        environ = {'CATALYST_ROOT': self.instance_tmpdir.path}
+        arrays = [np.arange(n, dtype='float64') for n in (3, 7, 1000)]
+
+        save_algo_object('test_algo', 'arrays', arrays, environ=environ)
+        observed = get_algo_object('test_algo', 'arrays', environ=environ)
+
+        for expected, array in zip(arrays, observed):
+            np.testing.assert_array_equal(array, expected)
+            assert (array.flags.aligned)
+            assert (array.flags.writeable)
+
+            if hasattr(pickle, 'PickleBuffer') and os.name != 'nt':
+                # rebuilt in place from the memory-mapped file
+                assert (array.ctypes.data % 64 == 0)
+
+    def test_algo_df_round_trip(self):
+        environ = {'CATALYST_ROOT': self.instance_tmpdir.path}
+        df = DataFrame(
+            data=[dict(performance=0.5), dict(performance=-0.25)],
+            index=[Timestamp('2018-03-01 09:45:00+0000', tz='UTC'),
+                   Timestamp('2018-03-01 09:46:00+0000', tz='UTC')],
+        )
+
+        save_algo_df('test_algo', 'pnl_stats', df, environ=environ)
+        assert (get_algo_df('test_algo', 'pnl_stats',
+                            environ=environ).equals(df))
+
+        # frames saved as csv by earlier versions are still readable
+        folder = get_algo_folder('test_algo', environ)
+        df.to_csv(os.path.join(folder, 'legacy_stats.csv'))
+        observed = get_algo_df('test_algo', 'legacy_stats', environ=environ)
+        assert (observed['performance'].tolist() == [0.5, -0.25])
+
+        assert (get_algo_df('test_algo', 'missing', environ=environ).empty)
+
+    @skipIf(pa is None, 'pyarrow is not installed')
+    def test_algo_df_parquet_round_trip(self):
+        environ = {'CATALYST_ROOT': self.instance_tmpdir.path}
+        df = DataFrame(
+            data=[dict(performance=0.5), dict(performance=-0.25)],
+            index=[Timestamp('2018-03-01 09:45:00+0000', tz='UTC'),
+                   Timestamp('2018-03-01 09:46:00+0000', tz='UTC')],
+        )
+
+        save_algo_df('test_algo', 'pnl_stats', df, environ=environ,
+                     how='parquet')
+        assert (get_algo_df('test_algo', 'pnl_stats', environ=environ,
+                            how='parquet').equals(df))
+
+        # the pickle of the same key is a different file
+        assert (get_algo_df('test_algo', 'pnl_stats', environ=environ).empty)
+
+    @skipIf(pa is None, 'pyarrow is not installed')
+    def test_algo_object_arrow_round_trip(self):
+        environ = {'CATALYST_ROOT': self.instance_tmpdir.path}
+        df = DataFrame(
+            data=np.random.rand(10, 2),
+            index=date_range('2018-03-01', periods=10, freq='T', tz='UTC'),
+            columns=['price', 'volume'],
+        )
+
+        save_algo_object('test_algo', 'state', df, environ=environ,
+                         how='arrow')
+        observed = get_algo_object('test_algo', 'state', environ=environ,
+                                   how='arrow')
+        assert (observed.equals(df))
+
+        assert (get_algo_object('test_algo', 'missing', environ=environ,
+                                how='arrow') is None)
+
+        # only DataFrames are supported
+        with self.assertRaises(ValueError):
+            save_algo_object('test_algo', 'state', dict(a=1),
+                             environ=environ, how='arrow')
+
+    def test_json_file_cache(self):
+        filename = os.path.join(self.instance_tmpdir.path, 'symbols.json')
+        with open(filename, 'wt') as handle:
+            json.dump(dict(btc_usdt=dict(symbol='btc_usdt')), handle)
+
+        cache = JSONFileCache()
+        data = cache.load(filename)
+        assert (cache.load(filename) is data)
+
+        # the file is parsed again once it changes on disk
+        with open(filename, 'wt') as handle:
+            json.dump(dict(eth_usdt=dict(symbol='eth_usdt')), handle)
+        os.utime(filename, (0, 0))
+
+        assert (list(cache.load(filename).keys()) == ['eth_usdt'])
+
+        # a file of the same size and modification time, renamed in place
+        tmp_filename = '{}.tmp'.format(filename)
+        with open(tmp_filename, 'wt') as handle:
+            json.dump(dict(ltc_usdt=dict(symbol='ltc_usdt')), handle)
+        _replace_file(tmp_filename, filename)
+        os.utime(filename, (0, 0))
+
+        assert (list(cache.load(filename).keys()) == ['ltc_usdt'])
+
+        # NaN is not valid RFC 8259 JSON but is written by the json module
+        with open(filename, 'wt') as handle:
+            json.dump(dict(xrp_usdt=dict(min_trade_size=np.nan)), handle)
+        os.utime(filename, (1, 1))
+
+        assert (np.isnan(cache.load(filename)['xrp_usdt']['min_trade_size']))
+
+    def test_resample_history_ohlcv(self):
+        fields = ['open', 'high', 'low', 'close', 'volume']
+        df = DataFrame(
+            data=np.random.rand(30, 5),
+            index=date_range('2018-03-01', periods=30, freq='T', tz='UTC'),
+            columns=fields,
+        )
+        start_dt = Timestamp('2018-03-01 00:10:00+0000', tz='UTC')
+
+        observed = resample_history_ohlcv(df, '5T', start_dt)
+
+        assert (observed.columns.tolist() == fields)
+        for field in fields:
+            expected = resample_history_df(df[[field]], '5T', field, start_dt)
+            assert (observed[[field]].equals(expected))
+
+        with self.assertRaises(ValueError):
+            resample_history_ohlcv(
+                df.rename(columns=dict(close='price')), '5T'
+            )
+
+    def test_get_frame_stats(self):
+        period_close = date_range(
+            '2018-03-01 09:45', periods=3, freq='T', tz='UTC'
+        )
+        saved_stats = [
+            dict(period_close=period_close[0], returns=0.1),
+            dict(period_close=period_close[1], returns=0.2),
+        ]
+
+        algo = Mock(spec=ExchangeTradingAlgorithmLive)
+        algo.algo_namespace = 'test_algo'
+        algo.frame_stats = [dict(period_close=period_close[2], returns=0.3)]
+
+        environ = {'CATALYST_ROOT': self.instance_tmpdir.path}
+        with patch.dict(os.environ, environ):
+            save_algo_object(
+                algo_name='test_algo',
+                key='2018-03-01',
+                obj=saved_stats,
+                rel_path='frame_stats',
+            )
+
+            # leftover of an interrupted save
+            folder = os.path.join(get_algo_folder('test_algo'), 'frame_stats')
+            with open(os.path.join(folder, '2018-03-02.p.tmp'), 'wb') as f:
+                f.write(b'partial')
+
+            stats = ExchangeTradingAlgorithmLive.get_frame_stats(algo)
+
+        assert (stats['returns'].tolist() == [0.1, 0.2, 0.3])
+
+    @skipIf(not LZ4, 'lz4 is not installed')
+    def test_frame_stats_compressed(self):
+        period_close = date_range(
+            '2018-03-01 09:45', periods=2, freq='T', tz='UTC'
+        )
+
+        algo = Mock(spec=ExchangeTradingAlgorithmLive)
+        algo.algo_namespace = 'test_algo'
+        algo.compress_state = True
+        algo.frame_stats = [dict(period_close=period_close[0], returns=0.1)]
+
+        environ = {'CATALYST_ROOT': self.instance_tmpdir.path}
+        with patch.dict(os.environ, environ):
+            ExchangeTradingAlgorithmLive.nullify_frame_stats(
+                algo, period_close[0]
+            )
+            assert (algo.frame_stats == [])
+
+            filename = os.path.join(
+                get_algo_folder('test_algo'), 'frame_stats', '2018-03-01.p'
+            )
+            with open(filename, 'rb') as f:
+                magic = f.read(len(PICKLE_LZ4_FRAMES_MAGIC))
+            assert (magic == PICKLE_LZ4_FRAMES_MAGIC)
+
+            algo.frame_stats = [
+                dict(period_close=period_close[1], returns=0.2)
+            ]
+            stats = ExchangeTradingAlgorithmLive.get_frame_stats(algo)
+
+        assert (stats['returns'].tolist() == [0.1, 0.2])
+
+    def test_init_exchanges(self):
+        exchanges = dict(
+            binance=Mock(), bitfinex=Mock(), poloniex=Mock(),
+        )
+        init_exchanges(exchanges)
+        for exchange in exchanges.values():
+            exchange.init.assert_called_once_with()
+
+        # an initialization error is raised to the caller once all the
+        # exchanges were initialized
+        exchanges['bitfinex'].init.side_effect = ValueError('no markets')
+        with self.assertRaises(ValueError):
+            init_exchanges(exchanges)
+
+        for exchange in exchanges.values():
+            assert (exchange.init.call_count == 2)
+
+    def test_get_common_assets(self):
+        def get_exchange(exchange_name, symbols):
+            exchange = Mock()
+            exchange.get_assets.return_value = [
+                Mock(symbol=symbol, exchange=exchange_name)
+                for symbol in symbols
+            ]
+            return exchange
+
+        exchanges = OrderedDict([
+            ('poloniex', get_exchange(
+                'poloniex', ['eth_btc', 'btc_usdt', 'xmr_btc']
+            )),
+            ('bitfinex', get_exchange(
+                'bitfinex', ['btc_usdt', 'eth_btc', 'iot_btc']
+            )),
+            ('binance', get_exchange(
+                'binance', ['btc_usdt', 'bnb_btc', 'eth_btc']
+            )),
+        ])
+
+        assets = get_common_assets(exchanges)
+
+        # one asset per exchange, in the exchanges order, for each symbol
+        assert (len(assets) == 6)
+        symbols = set()
+        for i in range(0, len(assets), len(exchanges)):
+            group = assets[i:i + len(exchanges)]
+            assert ([asset.exchange for asset in group] == list(exchanges))
+            assert (len(set(asset.symbol for asset in group)) == 1)
+            symbols.add(group[0].symbol)
+
+        assert (symbols == {'btc_usdt', 'eth_btc'})